@@ -3,6 +3,8 @@ import math
 import time
 from pathlib import Path
 
+from metrics import EconomyMetrics, METRICS_SAMPLE_INTERVAL
+
 # Константы
 SCREEN_WIDTH = 940
 SCREEN_HEIGHT = 640
@@ -12,6 +14,22 @@ GRID_OFFSET_X = 64
 GRID_OFFSET_Y = 64
 UI_PANEL_WIDTH = 300
 
+# Графики экономики
+METRICS_CHARTS = (
+    ("money", "Деньги", arcade.color.GOLD),
+    ("population", "Население", arcade.color.LIGHT_BLUE),
+    ("income", "Доход", arcade.color.LIGHT_GREEN),
+)
+CHART_LEFT = SCREEN_WIDTH - UI_PANEL_WIDTH + 20
+CHART_TOP = SCREEN_HEIGHT - 370
+CHART_WIDTH = UI_PANEL_WIDTH - 40
+CHART_HEIGHT = 50
+CHART_SPACING = 30
+
+# Выгрузка истории экономики
+METRICS_EXPORT_PATH = "metrics.csv"
+EXPORT_MESSAGE_TIME = 5  # секунд показа сообщения о выгрузке
+
 # Типы построек с путями к спрайтам
 BUILDING_TYPES = {
     1: {
@@ -45,6 +63,20 @@ BUILDING_TYPES = {
 }
 
 
+def chart_bottom(index):
+    """Возвращает нижнюю границу графика по его номеру"""
+    return CHART_TOP - CHART_HEIGHT - index * (CHART_HEIGHT + CHART_SPACING)
+
+
+def format_duration(seconds):
+    """Форматирует длительность для подписи графика"""
+    if seconds < 120:
+        return f"{seconds:.0f} с"
+    if seconds < 2 * 3600:
+        return f"{seconds / 60:.0f} мин"
+    return f"{seconds / 3600:.1f} ч"
+
+
 class Building(arcade.Sprite):
     def __init__(self, building_type, grid_x, grid_y, scale=1.0):
         self.type = building_type
@@ -174,6 +206,35 @@ class CityBuildingGame(arcade.Window):
         # Таймер для анимации
         self.animation_timer = 0
         
+        # История экономики для графиков
+        self.metrics = EconomyMetrics()
+        self.metrics_timer = 0
+        self.chart_shapes = arcade.shape_list.ShapeElementList()
+        self.chart_labels = [
+            arcade.Text(
+                label,
+                CHART_LEFT,
+                chart_bottom(i) + CHART_HEIGHT + 5,
+                self.ui_text_color,
+                12
+            )
+            for i, (name, label, color) in enumerate(METRICS_CHARTS)
+        ]
+        self.update_charts()
+        
+        # Сообщение о выгрузке истории
+        self.export_text = arcade.Text(
+            "",
+            SCREEN_WIDTH - UI_PANEL_WIDTH + 20,
+            40,
+            self.ui_text_color,
+            10,
+            width=UI_PANEL_WIDTH - 40,
+            multiline=True,
+            anchor_y="top"
+        )
+        self.export_message_timer = 0
+        
     def load_textures(self):
         """Загружает текстуры для зданий"""
         for building_id, data in BUILDING_TYPES.items():
@@ -446,6 +507,14 @@ class CityBuildingGame(arcade.Window):
             self.ui_text_color,
             16
         )
+        
+        # Графики экономики
+        self.chart_shapes.draw()
+        for label in self.chart_labels:
+            label.draw()
+        
+        if self.export_message_timer > 0:
+            self.export_text.draw()
     
     def draw_shop(self):
         """Рисует магазин построек"""
@@ -493,6 +562,40 @@ class CityBuildingGame(arcade.Window):
                 multiline=True
             )
     
+    def update_charts(self):
+        """Перестраивает графики экономики, вызывается после каждого замера"""
+        self.chart_shapes.clear()
+        level = self.metrics.best_level()
+        for i, (name, label, color) in enumerate(METRICS_CHARTS):
+            bottom = chart_bottom(i)
+            self.chart_shapes.append(arcade.shape_list.create_rectangle_filled(
+                CHART_LEFT + CHART_WIDTH / 2,
+                bottom + CHART_HEIGHT / 2,
+                CHART_WIDTH,
+                CHART_HEIGHT,
+                arcade.color.DARK_GRAY
+            ))
+            
+            points = self.metrics.series(name, level)
+            if len(points) < 2:
+                continue
+            
+            # Точки растягиваются на всю ширину, в подписи - охват по времени
+            start = points[0][0]
+            duration = points[-1][0] - start
+            values = [value for _, value in points]
+            low = min(values)
+            span = (max(values) - low) or 1.0
+            line = [
+                (CHART_LEFT + (t - start) / duration * CHART_WIDTH,
+                 bottom + (value - low) / span * CHART_HEIGHT)
+                for t, value in points
+            ]
+            self.chart_shapes.append(arcade.shape_list.create_line_strip(line, color, 2))
+            self.chart_labels[i].text = (
+                f"{label}: {values[-1]:.0f} (за {format_duration(duration)})"
+            )
+    
     def on_mouse_motion(self, x, y, dx, dy):
         # Обновляем состояние кнопок магазина (наведение)
         if self.show_shop:
@@ -615,6 +718,10 @@ class CityBuildingGame(arcade.Window):
         # Обновляем таймер анимации
         self.animation_timer += delta_time
         
+        # Сообщение о выгрузке гаснет через несколько секунд
+        if self.export_message_timer > 0:
+            self.export_message_timer -= delta_time
+        
         # Обновляем призрачное здание (пульсация)
         if self.ghost_building_sprite:
             # Пульсирующая прозрачность
@@ -626,13 +733,41 @@ class CityBuildingGame(arcade.Window):
         if self.income_timer >= 10:
             self.income_timer = 0
 
-            total_income = 0
-            for building in self.building_list:
-                if building.type == 3:  # Завод
-                    total_income += building.data["income"]
-
+            total_income = self.get_total_income()
             if total_income > 0:
                 self.money += total_income
+        
+        # Замеры экономики для графиков
+        self.metrics_timer += delta_time
+        if self.metrics_timer >= METRICS_SAMPLE_INTERVAL:
+            self.metrics_timer -= METRICS_SAMPLE_INTERVAL
+            self.metrics.sample(
+                money=self.money,
+                population=self.population,
+                income=self.get_total_income()
+            )
+            self.update_charts()
+    
+    def export_metrics(self):
+        """Сохраняет историю экономики в CSV и сообщает игроку результат"""
+        try:
+            path = Path(METRICS_EXPORT_PATH).resolve()
+            self.metrics.to_csv(path)
+        except OSError as error:
+            self.export_text.text = f"Не удалось сохранить статистику: {error.strerror or error}"
+            self.export_text.color = arcade.color.RED
+        else:
+            self.export_text.text = f"Статистика сохранена: {path}"
+            self.export_text.color = arcade.color.LIGHT_GREEN
+        self.export_message_timer = EXPORT_MESSAGE_TIME
+    
+    def get_total_income(self):
+        """Возвращает доход всех заводов за один цикл"""
+        total_income = 0
+        for building in self.building_list:
+            if building.type == 3:  # Завод
+                total_income += building.data["income"]
+        return total_income
     
     def on_key_press(self, key, modifiers):
         """Обработка нажатий клавиш"""
@@ -651,6 +786,10 @@ class CityBuildingGame(arcade.Window):
             self.money += 100
         elif key == arcade.key.O:
             self.population += 10
+        
+        # M для выгрузки истории экономики в CSV
+        elif key == arcade.key.M:
+            self.export_metrics()
 
 
 def main():
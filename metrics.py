@@ -0,0 +1,163 @@
+"""История экономики в кольцевых буферах фиксированного размера"""
+import csv
+from array import array
+
+# Метрики экономики
+METRICS_SAMPLE_INTERVAL = 1.0  # секунд между замерами
+METRICS_CAPACITY = 120  # точек в каждом уровне кольцевого буфера
+METRICS_DOWNSAMPLE = 10  # во сколько раз прореживается следующий уровень
+METRICS_TIERS = 4  # 120 с, 20 мин, 3.3 ч, 33 ч
+METRICS_SERIES = ("money", "population", "income")
+METRICS_COLUMNS = ("tier", "time") + METRICS_SERIES
+
+
+class RingBuffer:
+    """Кольцевой буфер фиксированного размера на заранее выделенном массиве"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.values = array("d", [0.0]) * capacity
+        self.start = 0
+        self.size = 0
+        self.total = 0  # сколько значений записано за всё время
+
+    def append(self, value):
+        end = (self.start + self.size) % self.capacity
+        self.values[end] = value
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+        self.total += 1
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        return self.values[(self.start + index) % self.capacity]
+
+    def to_list(self):
+        """Возвращает значения от старых к новым"""
+        end = self.start + self.size
+        if end <= self.capacity:
+            return self.values[self.start:end].tolist()
+        return (self.values[self.start:] + self.values[:end - self.capacity]).tolist()
+
+
+class EconomyMetrics:
+    """История экономики: несколько уровней кольцевых буферов.
+
+    Уровень 0 хранит каждый замер, каждый следующий уровень - средние
+    по METRICS_DOWNSAMPLE точкам предыдущего. Память и стоимость отрисовки
+    не зависят от длительности сессии.
+    """
+
+    def __init__(self, capacity=METRICS_CAPACITY, factor=METRICS_DOWNSAMPLE,
+                 tiers=METRICS_TIERS, interval=METRICS_SAMPLE_INTERVAL):
+        self.capacity = capacity
+        self.factor = factor
+        self.interval = interval
+        self.tiers = [
+            {name: RingBuffer(capacity) for name in METRICS_SERIES}
+            for _ in range(tiers)
+        ]
+        # Накопители сумм для прореживания в следующий уровень
+        self.pending = [
+            {name: 0.0 for name in METRICS_SERIES}
+            for _ in range(tiers)
+        ]
+        self.pending_count = [0] * tiers
+        self.samples = 0
+
+    def sample(self, **values):
+        """Записывает один замер и при необходимости прореживает его вверх"""
+        self.samples += 1
+        for level, buffers in enumerate(self.tiers):
+            for name in METRICS_SERIES:
+                buffers[name].append(values[name])
+
+            if level + 1 == len(self.tiers):
+                break
+
+            pending = self.pending[level]
+            for name in METRICS_SERIES:
+                pending[name] += values[name]
+            self.pending_count[level] += 1
+            if self.pending_count[level] < self.factor:
+                break
+
+            values = {name: pending[name] / self.factor for name in METRICS_SERIES}
+            for name in METRICS_SERIES:
+                pending[name] = 0.0
+            self.pending_count[level] = 0
+
+    def step(self, level):
+        """Длительность одной точки уровня в секундах"""
+        return self.interval * self.factor ** level
+
+    def best_level(self):
+        """Самый подробный уровень, который ещё хранит всю сессию"""
+        for level, buffers in enumerate(self.tiers):
+            buffer = buffers[METRICS_SERIES[0]]
+            if buffer.total <= buffer.capacity:
+                return level
+        return len(self.tiers) - 1
+
+    def now(self):
+        """Время последнего замера в секундах от начала сессии"""
+        return self.samples * self.interval
+
+    def series(self, name, level=None):
+        """Точки (время, значение) серии для графика, от старых к новым.
+
+        Грубый уровень получает точку раз в factor**level замеров, поэтому
+        в конец добавляется последний замер уровня 0 - график всегда
+        показывает текущее состояние.
+        """
+        if level is None:
+            level = self.best_level()
+        buffer = self.tiers[level][name]
+        offset = buffer.total - len(buffer)
+        step = self.step(level)
+        points = [
+            ((offset + i + 1) * step, value)
+            for i, value in enumerate(buffer.to_list())
+        ]
+
+        latest = self.tiers[0][name]
+        if len(latest) and buffer.total * self.factor ** level < self.samples:
+            points.append((self.now(), latest[len(latest) - 1]))
+        return points
+
+    def rows(self, level=0):
+        """Строки (время, money, population, income) уровня от старых к новым"""
+        buffers = self.tiers[level]
+        first = buffers[METRICS_SERIES[0]]
+        offset = first.total - len(first)
+        step = self.step(level)
+        columns = [buffers[name].to_list() for name in METRICS_SERIES]
+        return [
+            ((offset + i + 1) * step, *values)
+            for i, values in enumerate(zip(*columns))
+        ]
+
+    def all_rows(self):
+        """Строки (уровень, время, money, population, income) всех уровней"""
+        return [
+            (level, *row)
+            for level in range(len(self.tiers))
+            for row in self.rows(level)
+        ]
+
+    def to_csv(self, path):
+        """Сохраняет все уровни в CSV, уровень записывается в колонку tier"""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(METRICS_COLUMNS)
+            writer.writerows(self.all_rows())
+
+    def to_numpy(self):
+        """Возвращает все уровни как массив NumPy формы (N, 5)"""
+        import numpy as np
+
+        return np.array(self.all_rows(), dtype=np.float64).reshape(-1, len(METRICS_COLUMNS))
@@ -0,0 +1,101 @@
+import pytest
+
+from metrics import EconomyMetrics, RingBuffer
+
+
+def fill(metrics, count):
+    for i in range(count):
+        metrics.sample(money=i, population=i * 2, income=5)
+
+
+def test_ring_buffer_wraps_in_order():
+    buffer = RingBuffer(3)
+    for value in range(5):
+        buffer.append(value)
+
+    assert len(buffer) == 3
+    assert buffer.total == 5
+    assert buffer.to_list() == [2.0, 3.0, 4.0]
+    assert [buffer[i] for i in range(3)] == [2.0, 3.0, 4.0]
+
+
+def test_tier_means_after_factor_samples():
+    metrics = EconomyMetrics(capacity=10, factor=4, tiers=3)
+    fill(metrics, 3)
+    assert len(metrics.tiers[1]["money"]) == 0
+
+    metrics.sample(money=3, population=6, income=5)
+    assert metrics.tiers[1]["money"].to_list() == [1.5]
+    assert metrics.tiers[1]["population"].to_list() == [3.0]
+
+    metrics = EconomyMetrics(capacity=10, factor=4, tiers=3)
+    fill(metrics, 16)
+    assert metrics.tiers[1]["money"].to_list() == [1.5, 5.5, 9.5, 13.5]
+    assert metrics.tiers[2]["money"].to_list() == [7.5]
+    assert metrics.tiers[2]["income"].to_list() == [5.0]
+
+
+def test_best_level_switches_after_capacity():
+    metrics = EconomyMetrics(capacity=5, factor=2, tiers=3)
+    fill(metrics, 5)
+    assert metrics.best_level() == 0
+
+    fill(metrics, 1)
+    assert metrics.best_level() == 1
+
+
+def test_rows_timestamps_follow_tier_step():
+    metrics = EconomyMetrics(capacity=3, factor=2, tiers=2, interval=0.5)
+    fill(metrics, 5)
+
+    assert [row[0] for row in metrics.rows(0)] == [1.5, 2.0, 2.5]
+    assert [row[0] for row in metrics.rows(1)] == [1.0, 2.0]
+
+
+def test_to_numpy_empty():
+    np = pytest.importorskip("numpy")
+    array = EconomyMetrics().to_numpy()
+
+    assert array.shape == (0, 5)
+    assert array.dtype == np.float64
+
+
+def test_export_includes_every_tier(tmp_path):
+    metrics = EconomyMetrics(capacity=3, factor=2, tiers=3)
+    fill(metrics, 8)
+
+    rows = metrics.all_rows()
+    assert [row[0] for row in rows] == [0, 0, 0, 1, 1, 1, 2, 2]
+    assert rows[-1] == (2, 8.0, 5.5, 11.0, 5.0)
+
+    path = tmp_path / "metrics.csv"
+    metrics.to_csv(path)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "tier,time,money,population,income"
+    assert len(lines) == 1 + len(rows)
+
+
+def test_to_numpy_includes_every_tier():
+    pytest.importorskip("numpy")
+    metrics = EconomyMetrics(capacity=3, factor=2, tiers=3)
+    fill(metrics, 8)
+
+    array = metrics.to_numpy()
+    assert array.shape == (8, 5)
+    assert array[:, 0].tolist() == [0, 0, 0, 1, 1, 1, 2, 2]
+
+
+def test_series_ends_with_latest_sample():
+    metrics = EconomyMetrics(capacity=5, factor=2, tiers=3)
+    fill(metrics, 11)
+
+    points = metrics.series("money")
+    assert metrics.best_level() == 1
+    assert points[:-1] == [(2.0, 0.5), (4.0, 2.5), (6.0, 4.5), (8.0, 6.5), (10.0, 8.5)]
+    assert points[-1] == (11.0, 10.0)
+
+    # Когда уровень догнал последний замер, хвост не дублируется
+    metrics.sample(money=11, population=22, income=5)
+    points = metrics.series("money", level=1)
+    assert points[-1] == (12.0, 10.5)
+    assert len(points) == 5